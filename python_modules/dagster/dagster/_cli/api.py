@@ -50,6 +50,12 @@ def api_cli():
     """
 
 
+def _ignore_event(event: DagsterEvent) -> None:
+    # Run events are written to the event log by the instance as they are emitted, so the run
+    # commands have nothing further to do with them.
+    pass
+
+
 @api_cli.command(
     name="execute_run",
     help=(
@@ -63,15 +69,10 @@ def execute_run_command(input_json):
         args = deserialize_value(input_json, ExecuteRunArgs)
 
         with get_instance_for_cli(instance_ref=args.instance_ref) as instance:
-            buffer = []
-
-            def send_to_buffer(event):
-                buffer.append(serialize_value(event))
-
             return_code = _execute_run_command_body(
                 args.run_id,
                 instance,
-                send_to_buffer,
+                _ignore_event,
                 set_exit_code_on_failure=args.set_exit_code_on_failure or False,
             )
 
@@ -160,15 +161,10 @@ def resume_run_command(input_json):
         args = deserialize_value(input_json, ResumeRunArgs)
 
         with get_instance_for_cli(instance_ref=args.instance_ref) as instance:
-            buffer = []
-
-            def send_to_buffer(event):
-                buffer.append(serialize_value(event))
-
             return_code = _resume_run_command_body(
                 args.run_id,
                 instance,
-                send_to_buffer,
+                _ignore_event,
                 set_exit_code_on_failure=args.set_exit_code_on_failure or False,
             )
 
@@ -338,7 +334,8 @@ def execute_step_command(input_json, compressed_input_json):
                 instance,
                 dagster_run,
             ):
-                buff.append(serialize_value(event))
+                if args.print_serialized_events:
+                    buff.append(serialize_value(event))
 
             if args.print_serialized_events:
                 for line in buff:
@@ -72,6 +72,10 @@ class TemporalContext(NamedTuple):
 
 
 def _slice_from_subset(asset_graph_view: "AssetGraphView", subset: AssetSubset) -> "AssetSlice":
+    if isinstance(subset, ValidAssetSubset):
+        # already known to be compatible with the current partitions definition, so avoid
+        # re-checking compatibility and copying it into a new ValidAssetSubset
+        return AssetSlice(asset_graph_view, _AssetSliceCompatibleSubset(subset))
     valid_subset = subset.as_valid(
         asset_graph_view.asset_graph.get(subset.asset_key).partitions_def
     )
@@ -472,22 +476,31 @@ def _build_multi_partition_slice(
         # in the underlying PartitionsSet. We could add a specialized PartitionsSubset
         # subclass that itself composed two PartitionsSubset to avoid materializing the entire
         # partitions range.
-        return self.get_asset_slice(asset_key).compute_intersection_with_partition_keys(
-            {
-                MultiPartitionKey(
-                    {
-                        multi_dim_info.tw_dim.name: tw_pk,
-                        multi_dim_info.secondary_dim.name: secondary_pk,
-                    }
-                )
-                for tw_pk in multi_dim_info.tw_partition_def.get_partition_keys_in_time_window(
-                    last_tw
-                )
-                for secondary_pk in multi_dim_info.secondary_partition_def.get_partition_keys(
-                    current_time=self.effective_dt,
-                    dynamic_partitions_store=self._queryer,
-                )
-            }
+        #
+        # Every key is built from keys that are valid for their own dimension, so the slice is
+        # constructed directly rather than via compute_intersection_with_partition_keys, which
+        # would re-validate each key against the full MultiPartitionsDefinition.
+        return _slice_from_subset(
+            self,
+            AssetSubset.from_partition_keys(
+                asset_key,
+                check.not_none(self._get_partitions_def(asset_key)),
+                {
+                    MultiPartitionKey(
+                        {
+                            multi_dim_info.tw_dim.name: tw_pk,
+                            multi_dim_info.secondary_dim.name: secondary_pk,
+                        }
+                    )
+                    for tw_pk in multi_dim_info.tw_partition_def.get_partition_keys_in_time_window(
+                        last_tw
+                    )
+                    for secondary_pk in multi_dim_info.secondary_partition_def.get_partition_keys(
+                        current_time=self.effective_dt,
+                        dynamic_partitions_store=self._queryer,
+                    )
+                },
+            ),
         )
 
 
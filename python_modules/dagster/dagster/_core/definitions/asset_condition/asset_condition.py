@@ -4,6 +4,7 @@
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
+    Any,
     Dict,
     FrozenSet,
     List,
@@ -23,8 +24,10 @@
 from dagster._core.definitions.metadata import MetadataMapping, MetadataValue
 from dagster._core.definitions.partition import AllPartitionsSubset
 from dagster._model import DagsterModel
+from dagster._model.pydantic_compat_layer import USING_PYDANTIC_2
 from dagster._serdes.serdes import PackableValue, whitelist_for_serdes
 from dagster._utils.security import non_secure_md5_hash_str
+from dagster._utils.warnings import experimental_warning
 
 from ..asset_subset import AssetSubset, ValidAssetSubset
 from ..auto_materialize_rule import AutoMaterializeRule
@@ -279,8 +282,10 @@ class AssetCondition(ABC, DagsterModel):
             )
     """
 
-    @property
+    @functools.cached_property
     def unique_id(self) -> str:
+        # this is hashed recursively over the whole condition tree and accessed for every node on
+        # every evaluation, so compute it once per (immutable) condition
         parts = [
             self.__class__.__name__,
             *[child.unique_id for child in self.children],
@@ -350,30 +355,32 @@ def snapshot(self) -> AssetConditionSnapshot:
             unique_id=self.unique_id,
         )
 
+    # AssetConditions are immutable, so the factories below share a single condition tree per rule
+    # rather than allocating a new one on every call. The shared trees are built without running
+    # the @experimental constructor wrappers, so each factory emits those warnings itself
     @staticmethod
     def parent_newer() -> "AssetCondition":
         """Returns an AssetCondition that is true for an asset partition when at least one parent
         asset partition is newer than it.
         """
-        return RuleCondition(rule=AutoMaterializeRule.materialize_on_parent_updated())
+        experimental_warning("Class `RuleCondition`")
+        return _shared_rule_condition(AutoMaterializeRule.materialize_on_parent_updated())
 
     @staticmethod
     def missing() -> "AssetCondition":
         """Returns an AssetCondition that is true for an asset partition when it has never been
         materialized.
         """
-        from ..auto_materialize_rule import AutoMaterializeRule
-
-        return RuleCondition(rule=AutoMaterializeRule.materialize_on_missing())
+        experimental_warning("Class `RuleCondition`")
+        return _shared_rule_condition(AutoMaterializeRule.materialize_on_missing())
 
     @staticmethod
     def parent_missing() -> "AssetCondition":
         """Returns an AssetCondition that is true for an asset partition when at least one parent
         asset partition has never been materialized or observed.
         """
-        from ..auto_materialize_rule import AutoMaterializeRule
-
-        return RuleCondition(rule=AutoMaterializeRule.skip_on_parent_missing())
+        experimental_warning("Class `RuleCondition`")
+        return _shared_rule_condition(AutoMaterializeRule.skip_on_parent_missing())
 
     @staticmethod
     def updated_since_cron(cron_schedule: str, timezone: str = "UTC") -> "AssetCondition":
@@ -381,21 +388,22 @@ def updated_since_cron(cron_schedule: str, timezone: str = "UTC") -> "AssetCondi
         since the latest tick of the given cron schedule. For partitioned assets with a time
         component, this can only be true for the most recent partition.
         """
-        from ..auto_materialize_rule import AutoMaterializeRule
-
-        return ~RuleCondition(rule=AutoMaterializeRule.materialize_on_cron(cron_schedule, timezone))
+        experimental_warning("Class `RuleCondition`")
+        experimental_warning("Class `NotAssetCondition`")
+        return _shared_rule_condition(
+            AutoMaterializeRule.materialize_on_cron(cron_schedule, timezone), negate=True
+        )
 
     @staticmethod
     def parents_updated_since_cron(cron_schedule: str, timezone: str = "UTC") -> "AssetCondition":
         """Returns an AssetCondition that is true for an asset partition when all parent asset
         partitions have been updated more recently than the latest tick of the given cron schedule.
         """
-        from ..auto_materialize_rule import AutoMaterializeRule
-
-        return ~RuleCondition(
-            rule=AutoMaterializeRule.skip_on_not_all_parents_updated_since_cron(
-                cron_schedule, timezone
-            )
+        experimental_warning("Class `RuleCondition`")
+        experimental_warning("Class `NotAssetCondition`")
+        return _shared_rule_condition(
+            AutoMaterializeRule.skip_on_not_all_parents_updated_since_cron(cron_schedule, timezone),
+            negate=True,
         )
 
 
@@ -406,7 +414,7 @@ class RuleCondition(AssetCondition):
 
     rule: AutoMaterializeRule
 
-    @property
+    @functools.cached_property
     def unique_id(self) -> str:
         parts = [self.rule.__class__.__name__, self.description]
         return non_secure_md5_hash_str("".join(parts).encode())
@@ -506,8 +514,35 @@ def evaluate(self, context: "AssetConditionEvaluationContext") -> "AssetConditio
         return AssetConditionResult.create_from_children(context, true_subset, [child_result])
 
 
+@functools.lru_cache(maxsize=256)
+def _shared_rule_condition(rule: AutoMaterializeRule, negate: bool = False) -> AssetCondition:
+    """Returns a RuleCondition for the given rule, optionally negated, shared between all callers
+    that request the same rule. The (already valid) fields are set directly, which skips both
+    validation and the warnings emitted by the @experimental constructors.
+    """
+    if USING_PYDANTIC_2:
+        condition = RuleCondition.model_construct(rule=rule)
+        return NotAssetCondition.model_construct(operand=condition) if negate else condition
+    else:
+        condition = RuleCondition.construct(rule=rule)
+        return NotAssetCondition.construct(operand=condition) if negate else condition
+
+
 @dataclass(frozen=True)
 class AssetConditionResult:
+    # one of these is created per condition node per asset on every tick, so avoid a per-instance
+    # __dict__ (dataclass(slots=True) is not available on all supported Python versions)
+    __slots__ = (
+        "condition",
+        "start_timestamp",
+        "end_timestamp",
+        "true_subset",
+        "candidate_subset",
+        "subsets_with_metadata",
+        "extra_state",
+        "child_results",
+    )
+
     condition: AssetCondition
     start_timestamp: float
     end_timestamp: float
@@ -519,6 +554,15 @@ class AssetConditionResult:
     extra_state: PackableValue
     child_results: Sequence["AssetConditionResult"]
 
+    # frozen dataclasses restore slot state through their __setattr__, which raises, so copy and
+    # pickle need to go around it (this is what dataclass(slots=True) generates)
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
     @staticmethod
     def create_from_children(
         context: "AssetConditionEvaluationContext",
@@ -541,7 +585,7 @@ def create_from_children(
     def create(
         context: "AssetConditionEvaluationContext",
         true_subset: AssetSubset,
-        subsets_with_metadata: Sequence[AssetSubsetWithMetadata] = [],
+        subsets_with_metadata: Optional[Sequence[AssetSubsetWithMetadata]] = None,
         extra_state: PackableValue = None,
     ) -> "AssetConditionResult":
         """Returns a new AssetConditionEvaluation from the given parameters."""
@@ -551,7 +595,7 @@ def create(
             end_timestamp=pendulum.now("UTC").timestamp(),
             true_subset=true_subset,
             candidate_subset=context.candidate_subset,
-            subsets_with_metadata=subsets_with_metadata,
+            subsets_with_metadata=subsets_with_metadata or [],
             child_results=[],
             extra_state=extra_state,
         )
@@ -9,6 +9,7 @@
     AbstractSet,
     Any,
     Callable,
+    Dict,
     FrozenSet,
     Mapping,
     Optional,
@@ -31,7 +32,7 @@
 from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 from ..asset_subset import AssetSubset, ValidAssetSubset
-from ..base_asset_graph import BaseAssetGraph
+from ..base_asset_graph import BaseAssetGraph, ParentsPartitionsResult
 
 if TYPE_CHECKING:
     from ..asset_daemon_context import AssetDaemonContext
@@ -331,6 +332,32 @@ def materializable_in_same_run(self, child_key: AssetKey, parent_key: AssetKey)
             )
         )
 
+    @functools.cached_property
+    def parents_partitions_by_asset_partition(
+        self,
+    ) -> Dict[AssetKeyPartitionKey, ParentsPartitionsResult]:
+        """Parent asset partitions resolved so far during this evaluation. Only populated on the
+        root context, see `get_parents_partitions`.
+        """
+        return {}
+
+    def get_parents_partitions(
+        self, asset_partition: AssetKeyPartitionKey
+    ) -> ParentsPartitionsResult:
+        """Returns the parent asset partitions of the given asset partition. Results are shared
+        between all conditions evaluated for this asset, as sibling rules (e.g. parent updated and
+        parent missing) generally inspect the parents of the same asset partitions.
+        """
+        cache = self.root_context.parents_partitions_by_asset_partition
+        if asset_partition not in cache:
+            cache[asset_partition] = self.asset_graph.get_parents_partitions(
+                dynamic_partitions_store=self.instance_queryer,
+                current_time=self.instance_queryer.evaluation_time,
+                asset_key=asset_partition.asset_key,
+                partition_key=asset_partition.partition_key,
+            )
+        return cache[asset_partition]
+
     def get_parents_that_will_not_be_materialized_on_current_tick(
         self, *, asset_partition: AssetKeyPartitionKey
     ) -> AbstractSet[AssetKeyPartitionKey]:
@@ -339,12 +366,7 @@ def get_parents_that_will_not_be_materialized_on_current_tick(
         """
         return {
             parent
-            for parent in self.asset_graph.get_parents_partitions(
-                dynamic_partitions_store=self.instance_queryer,
-                current_time=self.instance_queryer.evaluation_time,
-                asset_key=asset_partition.asset_key,
-                partition_key=asset_partition.partition_key,
-            ).parent_partitions
+            for parent in self.get_parents_partitions(asset_partition).parent_partitions
             if not self.will_update_asset_partition(parent)
             or not self.materializable_in_same_run(asset_partition.asset_key, parent.asset_key)
         }
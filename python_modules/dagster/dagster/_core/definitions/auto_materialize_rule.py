@@ -1,3 +1,4 @@
+import functools
 from abc import ABC, abstractmethod, abstractproperty
 from typing import TYPE_CHECKING, Optional
 
@@ -74,6 +75,10 @@ def evaluate_for_asset(
         """
         ...
 
+    # rules are immutable NamedTuples, so the factories below share a single instance per set of
+    # arguments rather than allocating a new rule for every asset that references it. Only
+    # factories whose rules construct without warnings are cached, so that e.g. deprecation
+    # warnings still fire on every call
     @public
     @staticmethod
     def materialize_on_required_for_freshness() -> "MaterializeOnRequiredForFreshnessRule":
@@ -90,6 +95,7 @@ def materialize_on_required_for_freshness() -> "MaterializeOnRequiredForFreshnes
 
     @public
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def materialize_on_cron(
         cron_schedule: str, timezone: str = "UTC", all_partitions: bool = False
     ) -> "MaterializeOnCronRule":
@@ -142,6 +148,7 @@ def materialize_on_parent_updated(
 
     @public
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def materialize_on_missing() -> "MaterializeOnMissingRule":
         """Materialize an asset partition if it has never been materialized before. This rule will
         not fire for non-root assets unless that asset's parents have been updated.
@@ -152,6 +159,7 @@ def materialize_on_missing() -> "MaterializeOnMissingRule":
 
     @public
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def skip_on_parent_missing() -> "SkipOnParentMissingRule":
         """Skip materializing an asset partition if one of its parent asset partitions has never
         been materialized (for regular assets) or observed (for observable source assets).
@@ -162,6 +170,7 @@ def skip_on_parent_missing() -> "SkipOnParentMissingRule":
 
     @public
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def skip_on_parent_outdated() -> "SkipOnParentOutdatedRule":
         """Skip materializing an asset partition if any of its parents has not incorporated the
         latest data from its ancestors.
@@ -193,6 +202,7 @@ def skip_on_not_all_parents_updated(
         return SkipOnNotAllParentsUpdatedRule(require_update_for_all_parent_partitions)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def skip_on_not_all_parents_updated_since_cron(
         cron_schedule: str, timezone: str = "UTC"
     ) -> "SkipOnNotAllParentsUpdatedSinceCronRule":
@@ -214,6 +224,7 @@ def skip_on_not_all_parents_updated_since_cron(
 
     @public
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def skip_on_required_but_nonexistent_parents() -> "SkipOnRequiredButNonexistentParentsRule":
         """Skip an asset partition if it depends on parent partitions that do not exist.
 
@@ -246,6 +257,7 @@ def skip_on_backfill_in_progress(
         return SkipOnBackfillInProgressRule(all_partitions)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def skip_on_run_in_progress() -> "SkipOnRunInProgressRule":
         from dagster._core.definitions.auto_materialize_rule_impls import SkipOnRunInProgressRule
 
@@ -351,11 +351,8 @@ def evaluate_for_asset(
 
         subset_to_evaluate = context.parent_has_or_will_update_subset
         for asset_partition in subset_to_evaluate.asset_partitions:
-            parent_asset_partitions = context.asset_graph.get_parents_partitions(
-                dynamic_partitions_store=context.instance_queryer,
-                current_time=context.instance_queryer.evaluation_time,
-                asset_key=asset_partition.asset_key,
-                partition_key=asset_partition.partition_key,
+            parent_asset_partitions = context.get_parents_partitions(
+                asset_partition
             ).parent_partitions
 
             updated_parent_asset_partitions = context.instance_queryer.get_parent_asset_partitions_updated_after_child(
@@ -663,12 +660,7 @@ def evaluate_for_asset(
             | context.candidate_parent_has_or_will_update_subset
         )
         for candidate in subset_to_evaluate.asset_partitions:
-            parent_partitions = context.asset_graph.get_parents_partitions(
-                context.instance_queryer,
-                context.instance_queryer.evaluation_time,
-                context.asset_key,
-                candidate.partition_key,
-            ).parent_partitions
+            parent_partitions = context.get_parents_partitions(candidate).parent_partitions
 
             updated_parent_partitions = (
                 context.instance_queryer.get_parent_asset_partitions_updated_after_child(
@@ -942,11 +934,8 @@ def evaluate_for_asset(
             | context.candidate_parent_has_or_will_update_subset
         )
         for candidate in subset_to_evaluate.asset_partitions:
-            nonexistent_parent_partitions = context.asset_graph.get_parents_partitions(
-                context.instance_queryer,
-                context.instance_queryer.evaluation_time,
-                candidate.asset_key,
-                candidate.partition_key,
+            nonexistent_parent_partitions = context.get_parents_partitions(
+                candidate
             ).required_but_nonexistent_parents_partitions
 
             nonexistent_parent_keys = {parent.asset_key for parent in nonexistent_parent_partitions}
@@ -1,4 +1,6 @@
+import functools
 import os
+import sys
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import (
@@ -12,13 +14,14 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
 )
 
-from pydantic import Field
-from typing_extensions import Self, TypeAlias, TypeVar
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import Self, TypeAlias, TypeVar, get_args, get_origin
 
 import dagster._check as check
 import dagster._seven as seven
@@ -26,12 +29,14 @@
 from dagster._core.definitions.asset_key import AssetKey
 from dagster._core.errors import DagsterInvalidMetadata
 from dagster._model import DagsterModel
-from dagster._model.pydantic_compat_layer import model_fields
+from dagster._model.pydantic_compat_layer import USING_PYDANTIC_2, model_fields
 from dagster._serdes import whitelist_for_serdes
 from dagster._serdes.serdes import (
     FieldSerializer,
+    NamedTupleSerializer,
     PackableValue,
     UnpackContext,
+    UnpackedValue,
     WhitelistMap,
     pack_value,
 )
@@ -85,6 +90,13 @@ def normalize_metadata(
     # to convert arbitrary metadata (on e.g. OutputDefinition) to a MetadataValue, which is required
     # for serialization. This will cause unsupported values to be silently replaced with a
     # string placeholder.
+    if not allow_invalid:
+        try:
+            return {k: normalize_metadata_value(v) for k, v in metadata.items()}
+        except DagsterInvalidMetadata:
+            # fall through to the loop below, which reports the offending key
+            pass
+
     normalized_metadata: Dict[str, MetadataValue] = {}
     for k, v in metadata.items():
         try:
@@ -111,11 +123,21 @@ def normalize_metadata(
 
 
 def has_corresponding_metadata_value_class(obj: Any) -> bool:
-    return isinstance(obj, (str, float, bool, int, list, dict, os.PathLike, AssetKey, TableSchema))
+    return _type_has_corresponding_metadata_value_class(type(obj))
+
+
+@functools.lru_cache(maxsize=256)
+def _type_has_corresponding_metadata_value_class(obj_type: type) -> bool:
+    return issubclass(
+        obj_type, (str, float, bool, int, list, dict, os.PathLike, AssetKey, TableSchema)
+    )
 
 
 def normalize_metadata_value(raw_value: RawMetadataValue) -> "MetadataValue[Any]":
-    if isinstance(raw_value, MetadataValue):
+    normalizer = _METADATA_VALUE_NORMALIZERS_BY_TYPE.get(type(raw_value))
+    if normalizer is not None:
+        return normalizer(raw_value)
+    elif isinstance(raw_value, MetadataValue):
         return raw_value
     elif isinstance(raw_value, str):
         return MetadataValue.text(raw_value)
@@ -144,6 +166,65 @@ def normalize_metadata_value(raw_value: RawMetadataValue) -> "MetadataValue[Any]
     )
 
 
+T_DagsterModel = TypeVar("T_DagsterModel", bound=DagsterModel)
+
+
+def _construct_unchecked(model_cls: Type[T_DagsterModel], **kwargs: Any) -> T_DagsterModel:
+    """Constructs a model from field values that are already known to be valid, skipping pydantic
+    validation. Only for use by the `MetadataValue` static constructors, once they have checked
+    their inputs.
+    """
+    if USING_PYDANTIC_2:
+        return model_cls.model_construct(**kwargs)
+    else:
+        return model_cls.construct(**kwargs)
+
+
+_JSON_LEAF_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_plain_json_data(data: object) -> bool:
+    """Cheap check for the common case of JSON data built only from dicts with string keys, lists,
+    and scalars, which is guaranteed to be serializable. Returns False for anything else (including
+    structures where a container appears more than once), in which case the caller should fall back
+    to actually serializing the data.
+    """
+    seen_container_ids = set()
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type in _JSON_LEAF_TYPES:
+            continue
+        if value_type is not list and value_type is not dict:
+            return False
+        if id(value) in seen_container_ids:
+            return False
+        seen_container_ids.add(id(value))
+        if value_type is dict:
+            for key, inner_value in value.items():
+                if type(key) is not str:
+                    return False
+                stack.append(inner_value)
+        else:
+            stack.extend(value)
+    return True
+
+
+def _check_json_metadata_data(
+    data: Optional[Union[Sequence[Any], Mapping[str, Any]]],
+) -> Optional[Union[Sequence[Any], Mapping[str, Any]]]:
+    data = check.opt_inst_param(data, "data", (Sequence, Mapping))
+    if _is_plain_json_data(data):
+        return data
+    try:
+        # check that the value is JSON serializable
+        seven.dumps(data)
+    except TypeError:
+        raise DagsterInvalidMetadata("Value is not JSON serializable.")
+    return data
+
+
 # ########################
 # ##### METADATA VALUE
 # ########################
@@ -196,6 +277,8 @@ def emit_metadata(context, df):
         Args:
             text (str): The text string for a metadata entry.
         """
+        if type(text) is str:
+            return _construct_unchecked(TextMetadataValue, text=text)
         return TextMetadataValue(text)
 
     @public
@@ -220,6 +303,8 @@ def emit_metadata(context):
         Args:
             url (str): The URL for a metadata entry.
         """
+        if type(url) is str:
+            return _construct_unchecked(UrlMetadataValue, url=url)
         return UrlMetadataValue(url)
 
     @public
@@ -243,7 +328,9 @@ def emit_metadata(context):
         Args:
             path (str): The path for a metadata entry.
         """
-        return PathMetadataValue(path)
+        return _construct_unchecked(
+            PathMetadataValue, path=check.opt_path_param(path, "path", default="")
+        )
 
     @public
     @staticmethod
@@ -266,7 +353,9 @@ def emit_metadata(context):
         Args:
             path (str): The path to a notebook for a metadata entry.
         """
-        return NotebookMetadataValue(path)
+        return _construct_unchecked(
+            NotebookMetadataValue, path=check.opt_path_param(path, "path", default="")
+        )
 
     @public
     @staticmethod
@@ -291,6 +380,12 @@ def emit_metadata(context):
         Args:
             data (Union[Sequence[Any], Mapping[str, Any]]): The JSON data for a metadata entry.
         """
+        if type(data) is list and _is_plain_json_data(data):
+            # store a shallow copy, as pydantic validation does, so later changes to the caller's
+            # container aren't reflected in the metadata value
+            return _construct_unchecked(JsonMetadataValue, data=list(data))
+        elif type(data) is dict and _is_plain_json_data(data):
+            return _construct_unchecked(JsonMetadataValue, data=dict(data))
         return JsonMetadataValue(data)
 
     @public
@@ -316,6 +411,8 @@ def emit_metadata(context, md_str):
         Args:
             md_str (str): The markdown for a metadata entry.
         """
+        if type(data) is str:
+            return _construct_unchecked(MarkdownMetadataValue, md_str=data)
         return MarkdownMetadataValue(data)
 
     @public
@@ -342,7 +439,9 @@ def emit_metadata(context, df):
             value (Callable): The python class or function for a metadata entry.
         """
         check.callable_param(python_artifact, "python_artifact")
-        return PythonArtifactMetadataValue(python_artifact.__module__, python_artifact.__name__)
+        return _cached_python_artifact_metadata_value(
+            python_artifact.__module__, python_artifact.__name__
+        )
 
     @public
     @staticmethod
@@ -366,6 +465,8 @@ def emit_metadata(context, df):
         Args:
             value (float): The float value for a metadata entry.
         """
+        if type(value) is float:
+            return _construct_unchecked(FloatMetadataValue, value=value)
         return FloatMetadataValue(value)
 
     @public
@@ -390,6 +491,10 @@ def emit_metadata(context, df):
         Args:
             value (int): The int value for a metadata entry.
         """
+        if type(value) is int:
+            if _MIN_SHARED_INT_METADATA_VALUE <= value <= _MAX_SHARED_INT_METADATA_VALUE:
+                return _SHARED_INT_METADATA_VALUES[value - _MIN_SHARED_INT_METADATA_VALUE]
+            return _construct_unchecked(IntMetadataValue, value=value)
         return IntMetadataValue(value)
 
     @public
@@ -414,6 +519,8 @@ def emit_metadata(context, df):
         Args:
             value (bool): The bool value for a metadata entry.
         """
+        if type(value) is bool:
+            return _BOOL_METADATA_VALUES[value]
         return BoolMetadataValue(value)
 
     @public
@@ -429,14 +536,14 @@ def timestamp(value: Union["float", datetime]) -> "TimestampMetadataValue":
                 are not accepted, because their timestamps can be ambiguous.
         """
         if isinstance(value, float):
-            return TimestampMetadataValue(value)
+            return _construct_unchecked(TimestampMetadataValue, value=float(value))
         elif isinstance(value, datetime):
             if value.tzinfo is None:
                 check.failed(
                     "Datetime values provided to MetadataValue.timestamp must have timezones, "
                     f"but {value.isoformat()} does not"
                 )
-            return TimestampMetadataValue(value.timestamp())
+            return _construct_unchecked(TimestampMetadataValue, value=value.timestamp())
         else:
             check.failed(f"Expected either a float or a datetime, but received a {type(value)}")
 
@@ -448,6 +555,8 @@ def dagster_run(run_id: str) -> "DagsterRunMetadataValue":
         Args:
             run_id (str): The ID of the run.
         """
+        if type(run_id) is str:
+            return _construct_unchecked(DagsterRunMetadataValue, run_id=run_id)
         return DagsterRunMetadataValue(run_id)
 
     @public
@@ -471,10 +580,8 @@ def validate_table(context, df):
         Args:
             asset_key (AssetKey): The asset key referencing the asset.
         """
-        from dagster._core.definitions.events import AssetKey
-
         check.inst_param(asset_key, "asset_key", AssetKey)
-        return DagsterAssetMetadataValue(asset_key)
+        return _construct_unchecked(DagsterAssetMetadataValue, asset_key=asset_key)
 
     @public
     @staticmethod
@@ -505,7 +612,8 @@ def emit_metadata(context, df):
             repository_name (Optional[str]): The repository name of the job, if different from the
                 default.
         """
-        return DagsterJobMetadataValue(
+        return _construct_unchecked(
+            DagsterJobMetadataValue,
             job_name=check.str_param(job_name, "job_name"),
             location_name=check.str_param(location_name, "location_name"),
             repository_name=check.opt_str_param(repository_name, "repository_name"),
@@ -577,6 +685,8 @@ def table_schema(
         Args:
             schema (TableSchema): The table schema for a metadata entry.
         """
+        if isinstance(schema, TableSchema):
+            return _construct_unchecked(TableSchemaMetadataValue, schema=schema)
         return TableSchemaMetadataValue(schema)
 
     @public
@@ -591,6 +701,8 @@ def column_lineage(
         Args:
             lineage (TableColumnLineage): The column lineage for a metadata entry.
         """
+        if isinstance(lineage, TableColumnLineage):
+            return _construct_unchecked(TableColumnLineageMetadataValue, column_lineage=lineage)
         return TableColumnLineageMetadataValue(lineage)
 
     @public
@@ -599,7 +711,7 @@ def null() -> "NullMetadataValue":
         """Static constructor for a metadata value representing null. Can be used as the value type
         for the `metadata` parameter for supported events.
         """
-        return NullMetadataValue()
+        return _NULL_METADATA_VALUE
 
 
 # ########################
@@ -614,8 +726,17 @@ def null() -> "NullMetadataValue":
 # maintain backward compatibility. See docstring of `whitelist_for_serdes` for more info.
 
 
+class _MetadataValueModel(DagsterModel):
+    # Defer building each model's validator/serializer until it is first used. All of these models
+    # are defined when dagster is imported, but most processes only ever validate a few of them,
+    # and the `MetadataValue` static constructors usually skip validation entirely. Older pydantic
+    # 2.x releases without this setting ignore it.
+    if USING_PYDANTIC_2:
+        model_config = ConfigDict(defer_build=True)  # type: ignore
+
+
 @whitelist_for_serdes(storage_name="TextMetadataEntryData")
-class TextMetadataValue(DagsterModel, MetadataValue[str]):
+class TextMetadataValue(_MetadataValueModel, MetadataValue[str]):
     """Container class for text metadata entry data.
 
     Args:
@@ -640,7 +761,7 @@ def value(self) -> Optional[str]:
 
 
 @whitelist_for_serdes(storage_name="UrlMetadataEntryData")
-class UrlMetadataValue(DagsterModel, MetadataValue[str]):
+class UrlMetadataValue(_MetadataValueModel, MetadataValue[str]):
     """Container class for URL metadata entry data.
 
     Args:
@@ -666,7 +787,7 @@ def url(self) -> Optional[str]:
 
 
 @whitelist_for_serdes(storage_name="PathMetadataEntryData")
-class PathMetadataValue(DagsterModel, MetadataValue[str]):
+class PathMetadataValue(_MetadataValueModel, MetadataValue[str]):
     """Container class for path metadata entry data.
 
     Args:
@@ -691,7 +812,7 @@ def value(self) -> Optional[str]:
 
 
 @whitelist_for_serdes(storage_name="NotebookMetadataEntryData")
-class NotebookMetadataValue(DagsterModel, MetadataValue[str]):
+class NotebookMetadataValue(_MetadataValueModel, MetadataValue[str]):
     """Container class for notebook metadata entry data.
 
     Args:
@@ -716,7 +837,9 @@ def value(self) -> Optional[str]:
 
 
 @whitelist_for_serdes(storage_name="JsonMetadataEntryData")
-class JsonMetadataValue(DagsterModel, MetadataValue[Union[Sequence[Any], Mapping[str, Any]]]):
+class JsonMetadataValue(
+    _MetadataValueModel, MetadataValue[Union[Sequence[Any], Mapping[str, Any]]]
+):
     """Container class for JSON metadata entry data.
 
     Args:
@@ -726,13 +849,7 @@ class JsonMetadataValue(DagsterModel, MetadataValue[Union[Sequence[Any], Mapping
     data: PublicAttr[Optional[Union[Sequence[Any], Mapping[str, Any]]]]
 
     def __init__(self, data: Optional[Union[Sequence[Any], Mapping[str, Any]]]):
-        data = check.opt_inst_param(data, "data", (Sequence, Mapping))
-        try:
-            # check that the value is JSON serializable
-            seven.dumps(data)
-        except TypeError:
-            raise DagsterInvalidMetadata("Value is not JSON serializable.")
-        super().__init__(data=data)
+        super().__init__(data=_check_json_metadata_data(data))
 
     @public
     @property
@@ -742,7 +859,7 @@ def value(self) -> Optional[Union[Sequence[Any], Mapping[str, Any]]]:
 
 
 @whitelist_for_serdes(storage_name="MarkdownMetadataEntryData")
-class MarkdownMetadataValue(DagsterModel, MetadataValue[str]):
+class MarkdownMetadataValue(_MetadataValueModel, MetadataValue[str]):
     """Container class for markdown metadata entry data.
 
     Args:
@@ -763,7 +880,9 @@ def value(self) -> Optional[str]:
 
 # This should be deprecated or fixed so that `value` does not return itself.
 @whitelist_for_serdes(storage_name="PythonArtifactMetadataEntryData")
-class PythonArtifactMetadataValue(DagsterModel, MetadataValue["PythonArtifactMetadataValue"]):
+class PythonArtifactMetadataValue(
+    _MetadataValueModel, MetadataValue["PythonArtifactMetadataValue"]
+):
     """Container class for python artifact metadata entry data.
 
     Args:
@@ -785,7 +904,7 @@ def value(self) -> Self:
 
 
 @whitelist_for_serdes(storage_name="FloatMetadataEntryData")
-class FloatMetadataValue(DagsterModel, MetadataValue[float]):
+class FloatMetadataValue(_MetadataValueModel, MetadataValue[float]):
     """Container class for float metadata entry data.
 
     Args:
@@ -804,7 +923,7 @@ def value(self) -> Optional[float]:
 
 
 @whitelist_for_serdes(storage_name="IntMetadataEntryData")
-class IntMetadataValue(DagsterModel, MetadataValue[int]):
+class IntMetadataValue(_MetadataValueModel, MetadataValue[int]):
     """Container class for int metadata entry data.
 
     Args:
@@ -823,7 +942,7 @@ def value(self) -> Optional[int]:
 
 
 @whitelist_for_serdes(storage_name="BoolMetadataEntryData")
-class BoolMetadataValue(DagsterModel, MetadataValue[bool]):
+class BoolMetadataValue(_MetadataValueModel, MetadataValue[bool]):
     """Container class for bool metadata entry data.
 
     Args:
@@ -842,7 +961,7 @@ def value(self) -> Optional[bool]:
 
 
 @whitelist_for_serdes
-class TimestampMetadataValue(DagsterModel, MetadataValue[float]):
+class TimestampMetadataValue(_MetadataValueModel, MetadataValue[float]):
     """Container class for metadata value that's a unix timestamp.
 
     Args:
@@ -861,7 +980,7 @@ def value(self) -> Optional[float]:
 
 
 @whitelist_for_serdes(storage_name="DagsterPipelineRunMetadataEntryData")
-class DagsterRunMetadataValue(DagsterModel, MetadataValue[str]):
+class DagsterRunMetadataValue(_MetadataValueModel, MetadataValue[str]):
     """Representation of a dagster run.
 
     Args:
@@ -881,7 +1000,7 @@ def value(self) -> str:
 
 
 @whitelist_for_serdes
-class DagsterJobMetadataValue(DagsterModel, MetadataValue["DagsterJobMetadataValue"]):
+class DagsterJobMetadataValue(_MetadataValueModel, MetadataValue["DagsterJobMetadataValue"]):
     """Representation of a dagster run.
 
     Args:
@@ -914,7 +1033,7 @@ def value(self) -> Self:
 
 
 @whitelist_for_serdes(storage_name="DagsterAssetMetadataEntryData")
-class DagsterAssetMetadataValue(DagsterModel, MetadataValue[AssetKey]):
+class DagsterAssetMetadataValue(_MetadataValueModel, MetadataValue[AssetKey]):
     """Representation of a dagster asset.
 
     Args:
@@ -933,10 +1052,13 @@ def value(self) -> "AssetKey":
         return self.asset_key
 
 
+_COLUMN_TYPES_BY_VALUE_TYPE = {bool: "bool", int: "int", float: "float", str: "string"}
+
+
 # This should be deprecated or fixed so that `value` does not return itself.
 @experimental
 @whitelist_for_serdes(storage_name="TableMetadataEntryData")
-class TableMetadataValue(DagsterModel, MetadataValue["TableMetadataValue"]):
+class TableMetadataValue(_MetadataValueModel, MetadataValue["TableMetadataValue"]):
     """Container class for table metadata entry data.
 
     Args:
@@ -964,7 +1086,10 @@ class TableMetadataValue(DagsterModel, MetadataValue["TableMetadataValue"]):
     @staticmethod
     def infer_column_type(value: object) -> str:
         """str: Infer the :py:class:`TableSchema` column type that will be used for a value."""
-        if isinstance(value, bool):
+        column_type = _COLUMN_TYPES_BY_VALUE_TYPE.get(type(value))
+        if column_type is not None:
+            return column_type
+        elif isinstance(value, bool):
             return "bool"
         elif isinstance(value, int):
             return "int"
@@ -980,10 +1105,11 @@ def __init__(self, records: Sequence[TableRecord], schema: Optional[TableSchema]
         if len(records) == 0:
             schema = check.not_none(schema, "schema must be provided if records is empty")
         else:
-            columns = set(records[0].data.keys())
-            for record in records[1:]:
+            # dict key views compare as sets without building one per record
+            columns = records[0].data.keys()
+            for record in records:
                 check.invariant(
-                    set(record.data.keys()) == columns, "All records must have the same fields"
+                    record.data.keys() == columns, "All records must have the same fields"
                 )
             schema = schema or TableSchema(
                 columns=[
@@ -1007,7 +1133,7 @@ def value(self) -> Self:
 
 
 @whitelist_for_serdes(storage_name="TableSchemaMetadataEntryData")
-class TableSchemaMetadataValue(DagsterModel, MetadataValue[TableSchema]):
+class TableSchemaMetadataValue(_MetadataValueModel, MetadataValue[TableSchema]):
     """Representation of a schema for arbitrary tabular data.
 
     Args:
@@ -1032,7 +1158,7 @@ def schema(self) -> TableSchema:
 
 
 @whitelist_for_serdes
-class TableColumnLineageMetadataValue(DagsterModel, MetadataValue[TableColumnLineage]):
+class TableColumnLineageMetadataValue(_MetadataValueModel, MetadataValue[TableColumnLineage]):
     """Representation of the lineage of column inputs to column outputs of arbitrary tabular data.
 
     Args:
@@ -1053,7 +1179,7 @@ def value(self) -> TableColumnLineage:
 
 
 @whitelist_for_serdes(storage_name="NullMetadataEntryData")
-class NullMetadataValue(DagsterModel, MetadataValue[None]):
+class NullMetadataValue(_MetadataValueModel, MetadataValue[None]):
     """Representation of null."""
 
     @public
@@ -1063,6 +1189,71 @@ def value(self) -> None:
         return None
 
 
+# Metadata values are immutable, so the null value, both bool values, small int values, and
+# recently used python artifact values are shared between callers instead of being constructed
+# anew for every entry.
+_NULL_METADATA_VALUE = _construct_unchecked(NullMetadataValue)
+_BOOL_METADATA_VALUES = (
+    _construct_unchecked(BoolMetadataValue, value=False),
+    _construct_unchecked(BoolMetadataValue, value=True),
+)
+
+# Like CPython's small int cache, this is a fixed range rather than a cache of recently used values,
+# so runs that emit many distinct counts (row counts, byte sizes) don't churn it.
+_MIN_SHARED_INT_METADATA_VALUE = -5
+_MAX_SHARED_INT_METADATA_VALUE = 256
+_SHARED_INT_METADATA_VALUES = tuple(
+    _construct_unchecked(IntMetadataValue, value=value)
+    for value in range(_MIN_SHARED_INT_METADATA_VALUE, _MAX_SHARED_INT_METADATA_VALUE + 1)
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_python_artifact_metadata_value(module: str, name: str) -> PythonArtifactMetadataValue:
+    return PythonArtifactMetadataValue(module, name)
+
+
+# Maps the exact type of a raw metadata value to the constructor that normalizes it, so that the
+# common cases in `normalize_metadata_value` cost a single dict lookup. Values that are already
+# `MetadataValue`s map to themselves. Subclasses of these types fall through to the `isinstance`
+# checks.
+_METADATA_VALUE_NORMALIZERS_BY_TYPE: Mapping[type, Callable[[Any], MetadataValue]] = {
+    **{
+        metadata_value_type: lambda value: value
+        for metadata_value_type in (
+            TextMetadataValue,
+            UrlMetadataValue,
+            PathMetadataValue,
+            NotebookMetadataValue,
+            JsonMetadataValue,
+            MarkdownMetadataValue,
+            PythonArtifactMetadataValue,
+            FloatMetadataValue,
+            IntMetadataValue,
+            BoolMetadataValue,
+            TimestampMetadataValue,
+            DagsterRunMetadataValue,
+            DagsterJobMetadataValue,
+            DagsterAssetMetadataValue,
+            TableMetadataValue,
+            TableSchemaMetadataValue,
+            TableColumnLineageMetadataValue,
+            NullMetadataValue,
+        )
+    },
+    str: MetadataValue.text,
+    float: MetadataValue.float,
+    bool: MetadataValue.bool,
+    int: MetadataValue.int,
+    list: MetadataValue.json,
+    dict: MetadataValue.json,
+    AssetKey: MetadataValue.asset,
+    TableSchema: MetadataValue.table_schema,
+    TableColumnLineage: MetadataValue.column_lineage,
+    type(None): lambda _: MetadataValue.null(),
+}
+
+
 # ########################
 # ##### METADATA BACKCOMPAT
 # ########################
@@ -1072,6 +1263,79 @@ def value(self) -> None:
 # backcompat purposes.
 
 
+# Metadata value types whose fields normally hold JSON scalars. These make up most metadata entries,
+# so they are packed directly instead of going through the generic object serializer.
+_SCALAR_METADATA_VALUE_TYPES = {
+    TextMetadataValue,
+    UrlMetadataValue,
+    PathMetadataValue,
+    NotebookMetadataValue,
+    MarkdownMetadataValue,
+    FloatMetadataValue,
+    IntMetadataValue,
+    BoolMetadataValue,
+    TimestampMetadataValue,
+    DagsterRunMetadataValue,
+}
+
+# Storage names for the metadata value types packed directly below, along with the whitelist map
+# they were resolved from. Serializers are registered when their classes are defined, so each name
+# only needs to be looked up once rather than once per packed value.
+_METADATA_VALUE_STORAGE_NAMES: Dict[type, Tuple[WhitelistMap, str]] = {}
+
+
+def _get_metadata_value_storage_name(
+    value_type: type, whitelist_map: WhitelistMap
+) -> Optional[str]:
+    cached = _METADATA_VALUE_STORAGE_NAMES.get(value_type)
+    if cached is not None and cached[0] is whitelist_map:
+        return cached[1]
+
+    if not whitelist_map.has_object_serializer(value_type.__name__):
+        return None
+    storage_name = whitelist_map.get_object_serializer(value_type.__name__).get_storage_name()
+    _METADATA_VALUE_STORAGE_NAMES[value_type] = (whitelist_map, storage_name)
+    return storage_name
+
+
+@functools.lru_cache(maxsize=None)
+def _packed_field_keys(value_type: type) -> Sequence[Tuple[str, str]]:
+    """(attribute name, serialized key) pairs for the fields of a directly packed metadata value
+    type. Fields are serialized under their alias, if they have one.
+    """
+    return [(name, field.alias or name) for name, field in model_fields(value_type).items()]
+
+
+def _pack_metadata_value(
+    value: MetadataValue, whitelist_map: WhitelistMap, descent_path: str
+) -> Mapping[str, Any]:
+    value_type = type(value)
+    if value_type in _SCALAR_METADATA_VALUE_TYPES:
+        storage_name = _get_metadata_value_storage_name(value_type, whitelist_map)
+        fields = {key: getattr(value, name) for name, key in _packed_field_keys(value_type)}
+        if storage_name is not None and all(
+            type(field_value) in _JSON_LEAF_TYPES for field_value in fields.values()
+        ):
+            return {"__class__": storage_name, **fields}
+
+    if value_type is NullMetadataValue:
+        storage_name = _get_metadata_value_storage_name(value_type, whitelist_map)
+        if storage_name is not None:
+            return {"__class__": storage_name}
+
+    # MetadataValue itself can't inherit from NamedTuple and so isn't a PackableValue, but one of
+    # its subclasses will always be passed here.
+    return pack_value(value, whitelist_map, descent_path)  # type: ignore
+
+
+# Fields shared by every packed metadata entry. Copying this is cheaper than building each entry
+# dict from a literal.
+_PACKED_METADATA_ENTRY_TEMPLATE: Dict[str, Any] = {
+    "__class__": "EventMetadataEntry",
+    "description": None,
+}
+
+
 class MetadataFieldSerializer(FieldSerializer):
     """Converts between metadata dict (new) and metadata entries list (old)."""
 
@@ -1084,17 +1348,13 @@ def pack(
         whitelist_map: WhitelistMap,
         descent_path: str,
     ) -> Sequence[Mapping[str, Any]]:
-        return [
-            {
-                "__class__": "EventMetadataEntry",
-                "label": k,
-                # MetadataValue itself can't inherit from NamedTuple and so isn't a PackableValue,
-                # but one of its subclasses will always be returned here.
-                "entry_data": pack_value(v, whitelist_map, descent_path),  # type: ignore
-                "description": None,
-            }
-            for k, v in metadata_dict.items()
-        ]
+        packed_entries = []
+        for k, v in metadata_dict.items():
+            packed_entry = _PACKED_METADATA_ENTRY_TEMPLATE.copy()
+            packed_entry["label"] = k
+            packed_entry["entry_data"] = _pack_metadata_value(v, whitelist_map, descent_path)
+            packed_entries.append(packed_entry)
+        return packed_entries
 
     def unpack(
         self,
@@ -1102,12 +1362,41 @@ def unpack(
         whitelist_map: WhitelistMap,
         context: UnpackContext,
     ) -> Mapping[str, MetadataValue]:
-        return {e.label: e.entry_data for e in metadata_entries}
+        # labels repeat across every stored event, so share one string per label rather than
+        # holding a fresh copy for each deserialized event
+        return {sys.intern(e.label): e.entry_data for e in metadata_entries}
 
 
 T_MetadataValue = TypeVar("T_MetadataValue", bound=MetadataValue, covariant=True)
 
 
+_METADATA_ENTRY_FIELD_NAMES = frozenset(("label", "description", "entry_data"))
+
+
+class MetadataEntrySerializer(NamedTupleSerializer["MetadataEntry"]):
+    # Stored entries are unpacked once per metadata key of every deserialized event. Their entry
+    # data has already been unpacked to a MetadataValue, so when the stored fields are well-formed
+    # the renamed-param handling and checks in `MetadataEntry.__new__` are skipped.
+    def unpack(
+        self,
+        unpacked_dict: Dict[str, UnpackedValue],
+        whitelist_map: WhitelistMap,
+        context: UnpackContext,
+    ) -> "MetadataEntry":
+        label = unpacked_dict.get("label")
+        description = unpacked_dict.get("description")
+        entry_data = unpacked_dict.get("entry_data")
+        if (
+            not context.observed_unknown_serdes_values
+            and unpacked_dict.keys() <= _METADATA_ENTRY_FIELD_NAMES
+            and isinstance(label, str)
+            and (description is None or isinstance(description, str))
+            and isinstance(entry_data, MetadataValue)
+        ):
+            return tuple.__new__(MetadataEntry, (label, description, entry_data))
+        return super().unpack(unpacked_dict, whitelist_map, context)
+
+
 # NOTE: MetadataEntry is no longer accessible via the public API-- all metadata APIs use metadata
 # dicts. This clas shas only been preserved to adhere strictly to our backcompat guarantees. It is
 # still instantiated in the above `MetadataFieldSerializer` but that can easily be changed.
@@ -1118,7 +1407,7 @@ def unpack(
 @deprecated_param(
     param="entry_data", breaking_version="2.0", additional_warn_text="Use `value` instead."
 )
-@whitelist_for_serdes(storage_name="EventMetadataEntry")
+@whitelist_for_serdes(storage_name="EventMetadataEntry", serializer=MetadataEntrySerializer)
 class MetadataEntry(
     NamedTuple(
         "_MetadataEntry",
@@ -1182,6 +1471,77 @@ def value(self):
 T_NamespacedMetadataSet = TypeVar("T_NamespacedMetadataSet", bound="NamespacedMetadataSet")
 
 
+@functools.lru_cache(maxsize=None)
+def _namespaced_keys_by_field_name(
+    metadata_set_cls: Type["NamespacedMetadataSet"],
+) -> Mapping[str, str]:
+    """Maps each field of a NamespacedMetadataSet subclass to its namespaced metadata key. Fields
+    and namespaces are fixed when the class is defined, so this is computed once per class.
+    """
+    prefix = f"{metadata_set_cls.namespace()}/"
+    # interned so that lookups in metadata dicts built from these keys compare by identity
+    return {
+        field_name: sys.intern(prefix + field_name) for field_name in model_fields(metadata_set_cls)
+    }
+
+
+class _TrustedFieldTypes(NamedTuple):
+    # exact class that a field's values may have to skip validation, and whether None is allowed
+    types_by_field_name: Mapping[str, Tuple[type, bool]]
+    required_field_names: AbstractSet[str]
+
+
+@functools.lru_cache(maxsize=None)
+def _trusted_field_types(
+    metadata_set_cls: Type["NamespacedMetadataSet"],
+) -> Optional[_TrustedFieldTypes]:
+    """Describes which extracted values a NamespacedMetadataSet subclass can be constructed from
+    without validation: values whose type is exactly the class a field is annotated with (or None,
+    for Optional fields). Returns None if the class always needs validation, i.e. it customizes
+    __init__ or declares validators.
+    """
+    if not USING_PYDANTIC_2 or metadata_set_cls.__init__ is not DagsterModel.__init__:
+        return None
+    decorators = metadata_set_cls.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    ):
+        return None
+
+    types_by_field_name = {}
+    required_field_names = set()
+    for field_name, field in model_fields(metadata_set_cls).items():
+        if field.is_required():
+            required_field_names.add(field_name)
+        annotation = field.annotation
+        nullable = False
+        if get_origin(annotation) is Union:
+            non_null_args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            nullable = len(non_null_args) < len(get_args(annotation))
+            annotation = non_null_args[0] if len(non_null_args) == 1 else None
+        if isinstance(annotation, type) and not issubclass(annotation, BaseModel):
+            types_by_field_name[field_name] = (annotation, nullable)
+    return _TrustedFieldTypes(types_by_field_name, required_field_names)
+
+
+def _is_trusted_metadata_set_kwargs(
+    trusted_field_types: _TrustedFieldTypes, kwargs: Mapping[str, Any]
+) -> bool:
+    if not trusted_field_types.required_field_names <= kwargs.keys():
+        return False
+    for key, value in kwargs.items():
+        field_type = trusted_field_types.types_by_field_name.get(key)
+        if field_type is None:
+            return False
+        expected_type, nullable = field_type
+        if type(value) is not expected_type and not (nullable and value is None):
+            return False
+    return True
+
+
 class NamespacedMetadataSet(ABC, DagsterModel):
     """Extend this class to define a set of metadata fields in the same namespace.
 
@@ -1201,16 +1561,16 @@ def namespace(cls) -> str:
 
     @classmethod
     def _namespaced_key(cls, key: str) -> str:
-        return f"{cls.namespace()}/{key}"
+        return _namespaced_keys_by_field_name(cls).get(key) or f"{cls.namespace()}/{key}"
 
     @staticmethod
     def _strip_namespace_from_key(key: str) -> str:
-        return key.split("/", 1)[1]
+        return key.partition("/")[2]
 
     def keys(self) -> AbstractSet[str]:
         return {
-            self._namespaced_key(key)
-            for key in model_fields(self).keys()
+            namespaced_key
+            for key, namespaced_key in _namespaced_keys_by_field_name(type(self)).items()
             # getattr returns the pydantic property on the subclass
             if getattr(self, key) is not None
         }
@@ -1242,13 +1602,18 @@ class MyMetadataSet(NamedspacedMetadataSet):
             metadata (Mapping[str, Any]): A dictionary of metadata entries.
         """
         kwargs = {}
-        for namespaced_key, value in metadata.items():
-            splits = namespaced_key.split("/")
-            if len(splits) == 2:
-                namespace, key = splits
-                if namespace == cls.namespace() and key in model_fields(cls):
-                    kwargs[key] = value.value if isinstance(value, MetadataValue) else value
-
+        # look up each field rather than scanning the metadata, which is usually the larger side
+        for key, namespaced_key in _namespaced_keys_by_field_name(cls).items():
+            if namespaced_key in metadata:
+                value = metadata[namespaced_key]
+                kwargs[key] = value.value if isinstance(value, MetadataValue) else value
+
+        # skip validation when every value already has exactly the type its field declares
+        trusted_field_types = _trusted_field_types(cls)
+        if trusted_field_types is not None and _is_trusted_metadata_set_kwargs(
+            trusted_field_types, kwargs
+        ):
+            return _construct_unchecked(cls, **kwargs)
         return cls(**kwargs)
 
 
@@ -1184,6 +1184,22 @@ def can_deserialize(
             data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION
         )
 
+    def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        # operate directly on the underlying sets to avoid materializing intermediate copies
+        if isinstance(other, DefaultPartitionsSubset):
+            return self.__class__(self.subset | other.subset)
+        return super().__or__(other)
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, DefaultPartitionsSubset):
+            return self.__class__(self.subset - other.subset)
+        return super().__sub__(other)
+
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, DefaultPartitionsSubset):
+            return self.__class__(self.subset & other.subset)
+        return super().__and__(other)
+
     def __eq__(self, other: object) -> bool:
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
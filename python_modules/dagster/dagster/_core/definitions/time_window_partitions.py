@@ -62,6 +62,7 @@
 )
 from .partition import (
     DEFAULT_DATE_FORMAT,
+    AllPartitionsSubset,
     PartitionedConfig,
     PartitionsDefinition,
     PartitionsSubset,
@@ -1917,6 +1918,22 @@ def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
     def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if self is other:
             return self
+        # Anything & AllPartitionsSubset = Anything
+        if isinstance(other, AllPartitionsSubset):
+            return self
+        if (
+            isinstance(other, BaseTimeWindowPartitionsSubset)
+            and other.partitions_def == self.partitions_def
+        ):
+            smaller, larger = (self, other) if len(self) <= len(other) else (other, self)
+            if isinstance(smaller, PartitionKeysTimeWindowPartitionsSubset):
+                # the smaller operand is a sparse, key-backed subset, so only its keys need to be
+                # tested for membership rather than materializing every key of the larger operand
+                return self.empty_subset(self.partitions_def).with_partition_keys(
+                    partition_key
+                    for partition_key in smaller.get_partition_keys()
+                    if partition_key in larger
+                )
         return self.empty_subset(self.partitions_def).with_partition_keys(
             set(self.get_partition_keys()) & set(other.get_partition_keys())
         )
@@ -548,9 +548,13 @@ def __new__(
         if step_handle is not None and step_key is None:
             step_key = step_handle.to_key()
 
+        # store the enum's own value string, so that comparisons against it can short-circuit on
+        # identity
+        event_type = DagsterEventType(check.str_param(event_type_value, "event_type_value"))
+
         return super(DagsterEvent, cls).__new__(
             cls,
-            check.str_param(event_type_value, "event_type_value"),
+            event_type.value,
             check.str_param(job_name, "job_name"),
             check.opt_inst_param(
                 step_handle, "step_handle", (StepHandle, ResolvedFromDynamicStepHandle)
@@ -558,7 +562,7 @@ def __new__(
             check.opt_inst_param(node_handle, "node_handle", NodeHandle),
             check.opt_str_param(step_kind_value, "step_kind_value"),
             check.opt_mapping_param(logging_tags, "logging_tags"),
-            _validate_event_specific_data(DagsterEventType(event_type_value), event_specific_data),
+            _validate_event_specific_data(event_type, event_specific_data),
             check.opt_str_param(message, "message"),
             check.opt_int_param(pid, "pid"),
             check.opt_str_param(step_key, "step_key"),
@@ -1,13 +1,22 @@
-from typing import Callable, Mapping, NamedTuple, Optional, Union
+from typing import Callable, Dict, Mapping, NamedTuple, Optional, Union, cast
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, public
 from dagster._core.definitions.asset_check_evaluation import AssetCheckEvaluation
 from dagster._core.definitions.events import AssetMaterialization, AssetObservation
 from dagster._core.definitions.logger_definition import LoggerDefinition
-from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.events import (
+    AssetObservationData,
+    DagsterEvent,
+    DagsterEventType,
+    StepMaterializationData,
+)
 from dagster._core.utils import coerce_valid_log_level
 from dagster._serdes.serdes import (
+    NamedTupleSerializer,
+    UnpackContext,
+    UnpackedValue,
+    WhitelistMap,
     deserialize_value,
     serialize_value,
     whitelist_for_serdes,
@@ -19,8 +28,77 @@
     construct_single_handler_logger,
 )
 
+# DagsterEvent stores these exact string objects as its event_type_value, so comparing against them
+# (rather than against the enum members) hits the identity fast path of str equality.
+_ASSET_MATERIALIZATION_EVENT_TYPE_VALUE = DagsterEventType.ASSET_MATERIALIZATION.value
+_ASSET_OBSERVATION_EVENT_TYPE_VALUE = DagsterEventType.ASSET_OBSERVATION.value
+_ASSET_CHECK_EVALUATION_EVENT_TYPE_VALUE = DagsterEventType.ASSET_CHECK_EVALUATION.value
+
+
+_EVENT_LOG_ENTRY_STORAGE_FIELD_NAMES = frozenset(
+    (
+        "error_info",
+        "level",
+        "user_message",
+        "run_id",
+        "timestamp",
+        "step_key",
+        "pipeline_name",
+        "dagster_event",
+        "message",
+    )
+)
+
+
+class EventLogEntrySerializer(NamedTupleSerializer["EventLogEntry"]):
+    # Event log reads deserialize every stored row. Rows with the current set of fields and
+    # already-normalized values are rebuilt directly, skipping the param checks and log level
+    # coercion in `EventLogEntry.__new__`. Anything else (old rows, unknown values) goes through
+    # the regular path.
+    def unpack(
+        self,
+        unpacked_dict: Dict[str, UnpackedValue],
+        whitelist_map: WhitelistMap,
+        context: UnpackContext,
+    ) -> "EventLogEntry":
+        error_info = unpacked_dict.get("error_info")
+        level = unpacked_dict.get("level")
+        user_message = unpacked_dict.get("user_message")
+        run_id = unpacked_dict.get("run_id")
+        timestamp = unpacked_dict.get("timestamp")
+        step_key = unpacked_dict.get("step_key")
+        job_name = unpacked_dict.get("pipeline_name")
+        dagster_event = unpacked_dict.get("dagster_event")
+        if (
+            not context.observed_unknown_serdes_values
+            and unpacked_dict.keys() == _EVENT_LOG_ENTRY_STORAGE_FIELD_NAMES
+            and (error_info is None or isinstance(error_info, SerializableErrorInfo))
+            and type(level) is int
+            and type(user_message) is str
+            and type(run_id) is str
+            and type(timestamp) is float
+            and (step_key is None or type(step_key) is str)
+            and (job_name is None or type(job_name) is str)
+            and (dagster_event is None or isinstance(dagster_event, DagsterEvent))
+        ):
+            return tuple.__new__(
+                EventLogEntry,
+                (
+                    error_info,
+                    level,
+                    user_message,
+                    run_id,
+                    timestamp,
+                    step_key,
+                    job_name,
+                    dagster_event,
+                ),
+            )
+        return super().unpack(unpacked_dict, whitelist_map, context)
+
 
 @whitelist_for_serdes(
+    serializer=EventLogEntrySerializer,
     # These were originally distinguished from each other but ended up being empty subclasses
     # of EventLogEntry -- instead of using the subclasses we were relying on
     # EventLogEntry.is_dagster_event to distinguish events that originate in the logging
@@ -67,6 +145,8 @@ class EventLogEntry(
             structured event.
     """
 
+    __slots__ = ()
+
     def __new__(
         cls,
         error_info,
@@ -136,11 +216,13 @@ def message(self) -> str:
     def asset_materialization(self) -> Optional[AssetMaterialization]:
         if (
             self.dagster_event
-            and self.dagster_event.event_type_value == DagsterEventType.ASSET_MATERIALIZATION
+            and self.dagster_event.event_type_value == _ASSET_MATERIALIZATION_EVENT_TYPE_VALUE
         ):
-            materialization = self.dagster_event.step_materialization_data.materialization
-            if isinstance(materialization, AssetMaterialization):
-                return materialization
+            # DagsterEvent requires StepMaterializationData for materialization events, which in
+            # turn requires an AssetMaterialization, so the payload needs no further checks
+            return cast(
+                StepMaterializationData, self.dagster_event.event_specific_data
+            ).materialization
 
         return None
 
@@ -148,11 +230,12 @@ def asset_materialization(self) -> Optional[AssetMaterialization]:
     def asset_observation(self) -> Optional[AssetObservation]:
         if (
             self.dagster_event
-            and self.dagster_event.event_type_value == DagsterEventType.ASSET_OBSERVATION
+            and self.dagster_event.event_type_value == _ASSET_OBSERVATION_EVENT_TYPE_VALUE
         ):
-            observation = self.dagster_event.asset_observation_data.asset_observation
-            if isinstance(observation, AssetObservation):
-                return observation
+            # observation payloads aren't validated by DagsterEvent, so check the data type once
+            observation_data = self.dagster_event.event_specific_data
+            if isinstance(observation_data, AssetObservationData):
+                return observation_data.asset_observation
 
         return None
 
@@ -160,7 +243,7 @@ def asset_observation(self) -> Optional[AssetObservation]:
     def asset_check_evaluation(self) -> Optional[AssetCheckEvaluation]:
         if (
             self.dagster_event
-            and self.dagster_event.event_type_value == DagsterEventType.ASSET_CHECK_EVALUATION
+            and self.dagster_event.event_type_value == _ASSET_CHECK_EVALUATION_EVENT_TYPE_VALUE
         ):
             evaluation = self.dagster_event.asset_check_evaluation_data
             if isinstance(evaluation, AssetCheckEvaluation):
@@ -184,14 +267,15 @@ def tags(self) -> Optional[Mapping[str, str]]:
 def construct_event_record(logger_message: StructuredLoggerMessage) -> EventLogEntry:
     check.inst_param(logger_message, "logger_message", StructuredLoggerMessage)
 
+    meta = logger_message.meta
     return EventLogEntry(
         level=logger_message.level,
-        user_message=logger_message.meta["orig_message"],
-        run_id=logger_message.meta["run_id"],
+        user_message=meta["orig_message"],
+        run_id=meta["run_id"],
         timestamp=logger_message.record.created,
-        step_key=logger_message.meta.get("step_key"),
-        job_name=logger_message.meta.get("job_name"),
-        dagster_event=logger_message.meta.get("dagster_event"),
+        step_key=meta.get("step_key"),
+        job_name=meta.get("job_name"),
+        dagster_event=meta.get("dagster_event"),
         error_info=None,
     )
 
@@ -9,6 +9,7 @@
     StaticPartitionsDefinition,
 )
 from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     PartitionKeysTimeWindowPartitionsSubset,
     TimeWindowPartitionsDefinition,
@@ -213,3 +214,30 @@ def test_partitions_set_short_circuiting() -> None:
 
     # Test short-circuiting of -. Returns an empty DefaultPartitionsSubset
     assert (default_ps - all_ps) == DefaultPartitionsSubset.empty_subset()
+
+
+def test_default_partitions_subset_operations():
+    static_partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+    subset_a = static_partitions_def.empty_subset().with_partition_keys(["a", "b", "c"])
+    subset_b = static_partitions_def.empty_subset().with_partition_keys(["b", "c", "d"])
+
+    assert isinstance(subset_a & subset_b, DefaultPartitionsSubset)
+    assert set((subset_a & subset_b).get_partition_keys()) == {"b", "c"}
+    assert set((subset_a | subset_b).get_partition_keys()) == {"a", "b", "c", "d"}
+    assert set((subset_a - subset_b).get_partition_keys()) == {"a"}
+    assert len(subset_a - subset_a) == 0
+
+
+def test_time_window_partitions_subset_intersection_with_sparse_subset():
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
+    dense_subset = daily_partitions_def.empty_subset().with_partition_keys(
+        daily_partitions_def.get_partition_keys_in_range(
+            PartitionKeyRange("2023-01-01", "2023-03-01")
+        )
+    )
+    sparse_subset = PartitionKeysTimeWindowPartitionsSubset(
+        daily_partitions_def, included_partition_keys={"2023-01-05", "2023-04-01"}
+    )
+
+    assert set((dense_subset & sparse_subset).get_partition_keys()) == {"2023-01-05"}
+    assert set((sparse_subset & dense_subset).get_partition_keys()) == {"2023-01-05"}
@@ -1,6 +1,8 @@
+import json
 import logging
 from collections import defaultdict
 from typing import Callable, Mapping, Sequence
+from unittest import mock
 
 from dagster import DagsterEvent, job, op
 from dagster._core.definitions.graph_definition import GraphDefinition
@@ -9,7 +11,8 @@
 from dagster._core.events import DagsterEventType
 from dagster._core.events.log import EventLogEntry, construct_event_logger
 from dagster._loggers import colored_console_logger
-from dagster._serdes import deserialize_value
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes.serdes import NamedTupleSerializer
 
 
 def get_loggers(event_callback):
@@ -213,3 +216,65 @@ def test_event_forward_compat_without_event_specific_data():
         "'EVENT_TYPE_FROM_THE_FUTURE' is not a valid DagsterEventType"
         in result.event_specific_data.error.message
     )
+
+
+def _unpack_event_log_entry_fallback_calls(unpack_mock: mock.MagicMock) -> int:
+    return sum(1 for call in unpack_mock.call_args_list if call.args[0].klass is EventLogEntry)
+
+
+def test_event_log_entry_deserialize_fast_path():
+    records = []
+
+    @op
+    def op_one():
+        return 1
+
+    job_def = define_event_logging_job("fast_path_job", [op_one], records.append)
+    assert job_def.execute_in_process({"loggers": {"callback": {}}}).success
+    assert any(record.is_dagster_event for record in records)
+
+    serialized = [serialize_value(record) for record in records]
+    unpack = NamedTupleSerializer.unpack
+    with mock.patch.object(
+        NamedTupleSerializer, "unpack", autospec=True, side_effect=unpack
+    ) as unpack_mock:
+        deserialized = [deserialize_value(value, EventLogEntry) for value in serialized]
+
+    assert deserialized == records
+    # current rows are rebuilt directly rather than through EventLogEntry.__new__
+    assert _unpack_event_log_entry_fallback_calls(unpack_mock) == 0
+
+
+def test_event_log_entry_deserialize_legacy_row():
+    # written before EventLogEntry replaced DagsterEventRecord, with a log level name and without
+    # the message field
+    legacy_row = json.dumps(
+        {
+            "__class__": "DagsterEventRecord",
+            "dagster_event": None,
+            "error_info": None,
+            "level": "DEBUG",
+            "pipeline_name": "legacy_job",
+            "run_id": "legacy_run",
+            "step_key": None,
+            "timestamp": 1.0,
+            "user_message": "hello",
+        }
+    )
+
+    unpack = NamedTupleSerializer.unpack
+    with mock.patch.object(
+        NamedTupleSerializer, "unpack", autospec=True, side_effect=unpack
+    ) as unpack_mock:
+        entry = deserialize_value(legacy_row, EventLogEntry)
+
+    assert _unpack_event_log_entry_fallback_calls(unpack_mock) == 1
+    assert entry == EventLogEntry(
+        error_info=None,
+        level=logging.DEBUG,
+        user_message="hello",
+        run_id="legacy_run",
+        timestamp=1.0,
+        job_name="legacy_job",
+    )
+    assert entry.level == logging.DEBUG
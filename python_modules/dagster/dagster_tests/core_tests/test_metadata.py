@@ -1,5 +1,7 @@
+import pytest
 from dagster import (
     AssetKey,
+    AssetMaterialization,
     GraphDefinition,
     IntMetadataValue,
     JsonMetadataValue,
@@ -15,6 +17,7 @@
     UrlMetadataValue,
     op,
 )
+from dagster._core.errors import DagsterInvalidMetadata
 from dagster._serdes.serdes import deserialize_value, serialize_value
 
 
@@ -105,3 +108,44 @@ def test_table_schema_metadata_value():
 def test_json_metadata_value():
     assert JsonMetadataValue({"a": "b"}).data == {"a": "b"}
     assert JsonMetadataValue({"a": "b"}).value == {"a": "b"}
+
+
+def test_json_metadata_value_serializability_check():
+    nested = {"a": [1, 2.5, None, True, {"b": "c"}], "d": {}}
+    assert JsonMetadataValue(nested).value == nested
+
+    # tuples aren't covered by the fast path but are still serializable
+    assert JsonMetadataValue([("a", "b")]).value == [("a", "b")]
+
+    with pytest.raises(DagsterInvalidMetadata, match="not JSON serializable"):
+        JsonMetadataValue({"a": [object()]})
+
+
+def test_deserialize_metadata_entries():
+    metadata = {"foo": MetadataValue.int(1), "bar": MetadataValue.text("baz")}
+    materialization = AssetMaterialization("a", metadata=metadata)
+    assert deserialize_value(serialize_value(materialization), AssetMaterialization) == (
+        materialization
+    )
+
+    # legacy entries with raw entry data still go through MetadataEntry normalization
+    legacy = serialize_value(materialization).replace(
+        '{"__class__": "IntMetadataEntryData", "value": 1}', "1"
+    )
+    assert deserialize_value(legacy, AssetMaterialization).metadata == metadata
+
+
+def test_serialize_table_schema_after_mutation():
+    columns = [TableColumn(name="a", type="int")]
+    materialization = AssetMaterialization(
+        "a", metadata={"schema": MetadataValue.table_schema(TableSchema(columns=columns))}
+    )
+    assert '"b"' not in serialize_value(materialization)
+
+    # the schema holds the caller's list, so later serializations must reflect its contents
+    columns.append(TableColumn(name="b", type="str"))
+    serialized = serialize_value(materialization)
+    assert '"b"' in serialized
+    assert deserialize_value(serialized, AssetMaterialization).metadata["schema"].value == (
+        TableSchema(columns=columns)
+    )
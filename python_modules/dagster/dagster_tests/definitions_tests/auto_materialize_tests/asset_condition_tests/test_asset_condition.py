@@ -1,11 +1,20 @@
-from dagster import AutoMaterializePolicy, Definitions, asset
+import copy
+import pickle
+import warnings
+from unittest import mock
+
+from dagster import AutoMaterializePolicy, AutoMaterializeRule, Definitions, asset
 from dagster._core.definitions.asset_condition.asset_condition import (
     AssetCondition,
     AssetConditionEvaluation,
+    OrAssetCondition,
+    RuleCondition,
 )
+from dagster._core.definitions.base_asset_graph import BaseAssetGraph
 from dagster._core.remote_representation.external_data import external_repository_data_from_def
 from dagster._serdes import serialize_value
 from dagster._serdes.serdes import deserialize_value
+from dagster._utils.warnings import ExperimentalWarning
 
 from ..base_scenario import run_request
 from ..scenario_specs import (
@@ -13,6 +22,8 @@
     day_partition_key,
     one_asset,
     time_partitions_start_datetime,
+    two_assets_in_sequence,
+    two_partitions_def,
 )
 from .asset_condition_scenario import AssetConditionScenarioState
 
@@ -71,6 +82,48 @@ def test_missing_time_partitioned() -> None:
     assert result.true_subset.size == 4
 
 
+def test_result_copy_and_pickle() -> None:
+    state = AssetConditionScenarioState(one_asset, asset_condition=AssetCondition.missing())
+    _, result = state.evaluate("A")
+
+    for copied in (copy.copy(result), copy.deepcopy(result), pickle.loads(pickle.dumps(result))):
+        assert copied == result
+        assert copied.true_subset.size == 1
+
+
+def test_parent_partitions_shared_across_rules() -> None:
+    rule_conditions = [
+        AutoMaterializeRule.skip_on_parent_missing().to_asset_condition(),
+        AutoMaterializeRule.skip_on_not_all_parents_updated().to_asset_condition(),
+        AutoMaterializeRule.skip_on_required_but_nonexistent_parents().to_asset_condition(),
+    ]
+    state = AssetConditionScenarioState(
+        two_assets_in_sequence, asset_condition=OrAssetCondition(operands=rule_conditions)
+    ).with_asset_properties(partitions_def=two_partitions_def)
+    state = state.with_runs(run_request("A", "1"))
+
+    get_parents_partitions = BaseAssetGraph.get_parents_partitions
+    with mock.patch.object(
+        BaseAssetGraph,
+        "get_parents_partitions",
+        autospec=True,
+        side_effect=get_parents_partitions,
+    ) as get_parents_partitions_mock:
+        _, result = state.evaluate("B")
+
+    # each partition of B has its parents resolved once, no matter how many rules inspect them
+    assert get_parents_partitions_mock.call_count == 2
+
+    # each rule still returns the same result as when it is evaluated on its own
+    for rule_condition, child_result in zip(rule_conditions, result.child_results):
+        rule_state = AssetConditionScenarioState(
+            state.scenario_spec, asset_condition=rule_condition, instance=state.instance
+        )
+        _, rule_result = rule_state.evaluate("B")
+        assert child_result.true_subset == rule_result.true_subset
+    assert [child_result.true_subset.size for child_result in result.child_results] == [1, 1, 0]
+
+
 def test_serialize_definitions_with_asset_condition():
     amp = AutoMaterializePolicy.from_asset_condition(
         AssetCondition.parent_newer() & ~AssetCondition.updated_since_cron("0 * * * *")
@@ -84,3 +137,39 @@ def my_asset():
         external_repository_data_from_def(Definitions(assets=[my_asset]).get_repository_def())
     )
     assert isinstance(result, str)
+
+
+def test_asset_condition_factories_are_memoized() -> None:
+    assert AssetCondition.missing() is AssetCondition.missing()
+    assert AssetCondition.parent_newer() is AssetCondition.parent_newer()
+    assert AssetCondition.updated_since_cron("0 * * * *") is AssetCondition.updated_since_cron(
+        "0 * * * *"
+    )
+    assert AssetCondition.updated_since_cron("0 * * * *") != AssetCondition.updated_since_cron(
+        "0 0 * * *"
+    )
+
+
+def test_asset_condition_factories_warn_every_call() -> None:
+    for _ in range(2):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            AssetCondition.missing()
+            AssetCondition.updated_since_cron("0 * * * *")
+        assert [w.category for w in caught] == [ExperimentalWarning] * 3
+        assert all(w.filename == __file__ for w in caught)
+
+    # the caller's filters apply to the warnings
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        warnings.filterwarnings("ignore", category=ExperimentalWarning)
+        AssetCondition.missing()
+    assert caught == []
+
+    # the shared conditions serialize the same as ones constructed directly
+    assert serialize_value(AssetCondition.missing()) == serialize_value(
+        RuleCondition(rule=AutoMaterializeRule.materialize_on_missing())
+    )
+    assert serialize_value(AssetCondition.updated_since_cron("0 * * * *")) == serialize_value(
+        ~RuleCondition(rule=AutoMaterializeRule.materialize_on_cron("0 * * * *"))
+    )
@@ -1,3 +1,5 @@
+import warnings
+
 import pytest
 from dagster import AssetKey, AutoMaterializePolicy
 from dagster._check import CheckError
@@ -50,6 +52,43 @@ def test_without_rules():
     )
 
 
+def test_rule_factories_are_interned():
+    assert (
+        AutoMaterializeRule.materialize_on_missing() is AutoMaterializeRule.materialize_on_missing()
+    )
+    assert AutoMaterializeRule.materialize_on_cron("0 * * * *") is (
+        AutoMaterializeRule.materialize_on_cron("0 * * * *")
+    )
+    assert AutoMaterializeRule.materialize_on_cron("0 * * * *") != (
+        AutoMaterializeRule.materialize_on_cron("0 0 * * *")
+    )
+
+    # positional and keyword arguments are cached separately, but produce equal rules
+    assert AutoMaterializeRule.materialize_on_cron("0 * * * *", "UTC") == (
+        AutoMaterializeRule.materialize_on_cron(cron_schedule="0 * * * *", timezone="UTC")
+    )
+    assert AutoMaterializeRule.materialize_on_cron("0 * * * *", "UTC") == (
+        AutoMaterializeRule.materialize_on_cron("0 * * * *")
+    )
+
+    # invalid arguments still raise on every call
+    for _ in range(2):
+        with pytest.raises(CheckError):
+            AutoMaterializeRule.materialize_on_cron("not a cron schedule")
+
+
+def test_uncached_rule_factory_warns_every_call():
+    for _ in range(2):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            AutoMaterializeRule.materialize_on_required_for_freshness()
+        assert [w.category for w in caught] == [DeprecationWarning]
+
+    assert AutoMaterializeRule.materialize_on_required_for_freshness() == (
+        AutoMaterializeRule.materialize_on_required_for_freshness()
+    )
+
+
 def test_without_rules_invalid():
     simple_policy = AutoMaterializePolicy(
         rules={AutoMaterializeRule.materialize_on_parent_updated()}
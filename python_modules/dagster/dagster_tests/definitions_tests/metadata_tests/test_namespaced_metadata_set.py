@@ -0,0 +1,56 @@
+from typing import Optional
+
+import pytest
+from dagster import AssetMaterialization, TableColumn, TableSchema
+from dagster._core.definitions.metadata import NamespacedMetadataSet, TableMetadataSet
+from dagster._core.test_utils import raise_exception_on_warnings
+from pydantic import ValidationError
+
+
+@pytest.fixture(autouse=True)
+def error_on_warning():
+    raise_exception_on_warnings()
+
+
+class MyMetadataSet(NamespacedMetadataSet):
+    primitive_int: Optional[int] = None
+    primitive_float: Optional[float] = None
+
+    @classmethod
+    def namespace(cls) -> str:
+        return "foo"
+
+
+def test_extract_primitive_fields():
+    my_metadata = MyMetadataSet(primitive_int=5, primitive_float=1.5)
+    assert MyMetadataSet.extract(dict(my_metadata)) == my_metadata
+
+    materialization = AssetMaterialization(asset_key="a", metadata=dict(my_metadata))
+    assert MyMetadataSet.extract(materialization.metadata) == my_metadata
+
+    # keys from other namespaces or with extra path segments are ignored
+    assert (
+        MyMetadataSet.extract(
+            {"bar/primitive_int": 5, "foo/primitive_int/x": 5, "primitive_int": 5}
+        )
+        == MyMetadataSet()
+    )
+
+
+def test_extract_validates_mismatched_types():
+    # values that don't exactly match the declared type still go through validation
+    assert MyMetadataSet.extract({"foo/primitive_float": 5}) == MyMetadataSet(primitive_float=5.0)
+    assert isinstance(MyMetadataSet.extract({"foo/primitive_float": 5}).primitive_float, float)
+
+    with pytest.raises(ValidationError):
+        MyMetadataSet.extract({"foo/primitive_int": "not an int"})
+
+    with pytest.raises(ValidationError):
+        TableMetadataSet.extract({"dagster/column_schema": "not a schema"})
+
+
+def test_extract_table_metadata_set():
+    column_schema = TableSchema(columns=[TableColumn("foo", "str")])
+    extracted = TableMetadataSet.extract({"dagster/column_schema": column_schema, "other": 1})
+    assert extracted == TableMetadataSet(column_schema=column_schema)
+    assert dict(extracted) == {"dagster/column_schema": column_schema}
@@ -1,4 +1,5 @@
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 
 import pendulum
@@ -12,6 +13,7 @@
     FloatMetadataValue,
     IntMetadataValue,
     JsonMetadataValue,
+    MarkdownMetadataValue,
     MetadataValue,
     NullMetadataValue,
     PathMetadataValue,
@@ -42,6 +44,7 @@
 )
 from dagster._core.execution.execution_result import ExecutionResult
 from dagster._core.snap.node import build_node_defs_snapshot
+from pydantic import ValidationError
 
 
 def step_events_of_type(result: ExecutionResult, node_name: str, event_type: DagsterEventType):
@@ -190,6 +193,7 @@ def test_parse_null_metadata():
     metadata = {"foo": None}
     normalized = normalize_metadata(metadata)
     assert normalized["foo"] == NullMetadataValue()
+    assert normalized["foo"] is MetadataValue.null()
 
 
 def test_parse_list_metadata():
@@ -214,6 +218,143 @@ def test_parse_path_metadata():
     assert normalized["path"] == PathMetadataValue("/a/b.csv")
 
 
+def test_parse_metadata_value_subclasses():
+    class MyStr(str):
+        pass
+
+    class MyDict(dict):
+        pass
+
+    normalized = normalize_metadata({"str": MyStr("foo"), "dict": MyDict(a=1), "bool": True})
+    assert type(normalized["str"]) is TextMetadataValue
+    assert normalized["str"] == TextMetadataValue("foo")
+    assert type(normalized["dict"]) is JsonMetadataValue
+    assert normalized["dict"] == JsonMetadataValue({"a": 1})
+    assert type(normalized["bool"]) is BoolMetadataValue
+    assert normalized["bool"] == BoolMetadataValue(True)
+
+
+def test_static_constructors_match_validated_values():
+    expected_values = [
+        (MetadataValue.text("foo"), TextMetadataValue("foo")),
+        (MetadataValue.url("http://foo"), UrlMetadataValue("http://foo")),
+        (MetadataValue.path(Path("/a/b.csv")), PathMetadataValue("/a/b.csv")),
+        (MetadataValue.json({"foo": [1, 2]}), JsonMetadataValue({"foo": [1, 2]})),
+        (MetadataValue.float(1.5), FloatMetadataValue(1.5)),
+        (MetadataValue.int(3), IntMetadataValue(3)),
+        (MetadataValue.bool(True), BoolMetadataValue(True)),
+        (MetadataValue.timestamp(1.0), TimestampMetadataValue(1.0)),
+        (MetadataValue.null(), NullMetadataValue()),
+    ]
+    for value, expected in expected_values:
+        assert type(value) is type(expected)
+        assert value == expected
+
+    # immutable values that are commonly repeated are shared
+    assert MetadataValue.bool(False) is MetadataValue.bool(False)
+    assert MetadataValue.int(3) is MetadataValue.int(3)
+    for value in (-5, 0, 256):
+        assert MetadataValue.int(value) is MetadataValue.int(value)
+        assert MetadataValue.int(value) == IntMetadataValue(value)
+    for value in (-6, 257, 10**12):
+        assert MetadataValue.int(value) is not MetadataValue.int(value)
+        assert MetadataValue.int(value) == IntMetadataValue(value)
+
+    # values that aren't already the exact expected type still go through validation
+    assert type(MetadataValue.float(5).value) is float
+    assert MetadataValue.float(5).value == 5.0
+    assert type(MetadataValue.int(True).value) is int
+    assert MetadataValue.int(True).value == 1
+    with pytest.raises(ValidationError):
+        MetadataValue.text(5)  # type: ignore
+
+
+def test_json_metadata_value_does_not_alias_data():
+    for data in ({"foo": [1, 2]}, [1, {"foo": "bar"}]):
+        value = MetadataValue.json(data)
+        assert value == JsonMetadataValue(data)
+        assert value.data is not data
+
+    data = {"foo": 1}
+    value = MetadataValue.json(data)
+    data["bar"] = 2
+    assert value.data == {"foo": 1}
+
+
+def test_scalar_metadata_value_coercion():
+    # values that aren't exactly the expected type are coerced as they were by pydantic
+    for value in (True, 5, "1.5", Decimal("1.5")):
+        assert type(MetadataValue.float(value).value) is float  # type: ignore
+    assert MetadataValue.float("1.5").value == 1.5  # type: ignore
+    assert MetadataValue.timestamp(1.0) == TimestampMetadataValue(Decimal("1"))  # type: ignore
+
+    for value in (True, 2.0, "2", Decimal("2")):
+        int_value = MetadataValue.int(value)  # type: ignore
+        assert type(int_value.value) is int
+        assert int_value.value == (1 if value is True else 2)
+
+    assert MetadataValue.bool(1).value is True  # type: ignore
+    assert MetadataValue.bool("false").value is False  # type: ignore
+
+    with pytest.raises(ValidationError):
+        MetadataValue.float("foo")  # type: ignore
+    with pytest.raises(ValidationError):
+        MetadataValue.int(2.5)
+    with pytest.raises(ValidationError):
+        MetadataValue.bool("maybe")  # type: ignore
+
+
+def test_scalar_metadata_value_equality_is_type_aware():
+    assert MetadataValue.int(1) != MetadataValue.float(1.0)
+    assert MetadataValue.bool(True) != MetadataValue.int(1)
+    assert MetadataValue.text("a") != MetadataValue.url("a")
+    assert MetadataValue.path("a") != MetadataValue.notebook("a")
+    assert MetadataValue.float(1.0) != MetadataValue.timestamp(1.0)
+    assert MetadataValue.text("a") != ("a",)
+
+    assert MetadataValue.int(1) == IntMetadataValue(1)
+    assert hash(MetadataValue.int(1)) == hash(IntMetadataValue(1))
+    assert len({MetadataValue.int(1), MetadataValue.float(1.0), MetadataValue.bool(True)}) == 3
+
+    assert AssetMaterialization("x", metadata={"k": 1}) != AssetMaterialization(
+        "x", metadata={"k": True}
+    )
+
+
+def test_reference_metadata_value_equality_is_type_aware():
+    asset_value = MetadataValue.asset(AssetKey("foo"))
+    assert asset_value == MetadataValue.asset(AssetKey("foo"))
+    assert asset_value != (AssetKey("foo"),)
+
+    job_value = MetadataValue.job("foo", "bar", repository_name="baz")
+    assert job_value == MetadataValue.job("foo", "bar", repository_name="baz")
+    assert job_value != ("foo", "bar", "baz")
+
+    artifact_value = MetadataValue.python_artifact(AssetKey)
+    assert artifact_value == PythonArtifactMetadataValue(AssetKey.__module__, AssetKey.__name__)
+    assert artifact_value != (AssetKey.__module__, AssetKey.__name__)
+    assert len({asset_value, job_value, artifact_value, (AssetKey("foo"),)}) == 4
+
+
+def test_table_and_markdown_metadata_value_equality_is_type_aware():
+    assert MetadataValue.md("x") != MetadataValue.text("x")
+    assert MetadataValue.md("x") == MarkdownMetadataValue("x")
+
+    schema = TableSchema(columns=[TableColumn(name="foo", type="int")])
+    assert MetadataValue.table_schema(schema) == MetadataValue.table_schema(schema)
+    assert MetadataValue.table_schema(schema) != (schema,)
+
+    lineage = TableColumnLineage(
+        {"foo": [TableColumnDep(asset_key=AssetKey("bar"), column_name="baz")]}
+    )
+    assert MetadataValue.column_lineage(lineage) == TableColumnLineageMetadataValue(lineage)
+    assert MetadataValue.column_lineage(lineage) != (lineage,)
+
+    records = [TableRecord(dict(foo=1))]
+    assert MetadataValue.table(records, schema) == MetadataValue.table(records, schema)
+    assert MetadataValue.table(records, schema) != (records, schema)
+
+
 def test_bad_json_metadata_value():
     @op(out={})
     def the_op(context):